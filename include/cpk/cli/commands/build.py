@@ -2,6 +2,7 @@ import argparse
 import copy
 import datetime
 import json
+import logging
 import sys
 import time
 from typing import Optional, Iterator, List
@@ -14,8 +15,7 @@ from .endpoint import CLIEndpointInfoCommand
 from .info import CLIInfoCommand
 from .. import AbstractCLICommand
 from ..logger import cpklogger
-from ..utils import combine_args
-from ...project import CPKProject
+from ..utils import combine_args, get_project
 from ...constants import ARCH_TO_DOCKER_PLATFORM
 from ...exceptions import CPKProjectBuildException
 from ...types import Arguments, CPKMachine
@@ -119,7 +119,7 @@ class CLIBuildCommand(AbstractCLICommand):
         stime = time.time()
 
         # get project
-        project = CPKProject(parsed.workdir)
+        project = get_project(parsed)
 
         # show info about project
         CLIInfoCommand.execute(None, parsed)
@@ -246,7 +246,9 @@ class CLIBuildCommand(AbstractCLICommand):
                 "platforms": [platform]
             }
         )
-        cpklogger.debug("Build arguments:\n%s\n" % json.dumps(buildargs, sort_keys=True, indent=4))
+        if cpklogger.isEnabledFor(logging.DEBUG):
+            cpklogger.debug(
+                "Build arguments:\n%s\n" % json.dumps(buildargs, sort_keys=True, indent=4))
 
         # hook: pre-build
         project.trigger("pre-build")
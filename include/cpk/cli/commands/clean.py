@@ -3,10 +3,8 @@ from typing import Optional
 
 from cpk.cli.commands.info import CLIInfoCommand
 
-from cpk import CPKProject
-
 from .. import AbstractCLICommand, cpklogger
-from ..utils import combine_args
+from ..utils import combine_args, get_project
 from ...types import CPKMachine, Arguments
 
 
@@ -26,7 +24,7 @@ class CLICleanCommand(AbstractCLICommand):
         parsed = combine_args(parsed, kwargs)
         # ---
         # get project
-        project = CPKProject(parsed.workdir)
+        project = get_project(parsed)
 
         # show info about project
         CLIInfoCommand.execute(machine, parsed)
@@ -26,13 +26,11 @@ class CLIEndpointInfoCommand(AbstractCLICommand):
         # combine arguments
         parsed = combine_args(parsed, kwargs)
         # ---
-        # create docker client
-        docker = machine.get_client()
         # get info about docker endpoint
         if not parsed.quiet:
             cpklogger.info("Retrieving info about Docker endpoint...")
         # ---
-        epoint_info: SystemInfo = docker.info()
+        epoint_info: SystemInfo = machine.get_info()
         epoint: dict = {
             "Machine": machine.name,
             "Hostname": epoint_info.name,
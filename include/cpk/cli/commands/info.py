@@ -3,10 +3,9 @@ from typing import Optional
 
 import termcolor as tc
 
-from cpk import CPKProject
 from .. import AbstractCLICommand
 from ..logger import cpklogger
-from ..utils import combine_args, as_table
+from ..utils import combine_args, as_table, get_project
 from ...types import CPKMachine, Arguments
 
 
@@ -28,7 +27,7 @@ class CLIInfoCommand(AbstractCLICommand):
         cpklogger.info("Project workspace: {}".format(parsed.workdir))
 
         # get the project
-        project = CPKProject(parsed.workdir)
+        project = get_project(parsed)
 
         # index status
         index = tc.colored("Clean", "green") if project.is_clean() \
@@ -1,4 +1,5 @@
 import argparse
+import sys
 from typing import Optional
 
 from cpk import cpkconfig
@@ -29,11 +30,15 @@ class CLIMachineListCommand(AbstractCLICommand):
             return True
         # print table
         cpklogger.info(f"Number of machines found: {len(machines)}")
-        table_fmt = "   |    {:<8} {:<15} {:<10} {:<1}"
-        print("-" * (8 + 15 + 10 + 40))
-        print(table_fmt.format('ID', 'NAME', 'TYPE', 'ENDPOINT'))
-        for i, (name, machine) in enumerate(machines.items()):
-            print(table_fmt.format(i+1, name, machine.type, machine.base_url))
-        print()
+        fmt = "   |    {:<8} {:<15} {:<10} {:<1}".format
+        rows = [
+            "-" * (8 + 15 + 10 + 40),
+            fmt('ID', 'NAME', 'TYPE', 'ENDPOINT')
+        ]
+        rows.extend(
+            fmt(i+1, name, machine.type, machine.base_url)
+            for i, (name, machine) in enumerate(machines.items())
+        )
+        sys.stdout.write("\n".join(rows) + "\n\n")
         # ---
         return True
@@ -1,4 +1,5 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List
 
 import dockertown.exceptions
@@ -6,8 +7,7 @@ import dockertown.exceptions
 from .endpoint import CLIEndpointInfoCommand
 from .info import CLIInfoCommand
 from .. import AbstractCLICommand, cpklogger
-from ..utils import combine_args
-from ... import CPKProject
+from ..utils import combine_args, get_project
 from ...exceptions import CPKProjectPullException
 from ...types import CPKMachine, Arguments
 
@@ -40,13 +40,15 @@ class CLIPullCommand(AbstractCLICommand):
         parsed = combine_args(parsed, kwargs)
         # ---
         # get project
-        project = CPKProject(parsed.workdir)
+        project = get_project(parsed)
 
         # show info about project
-        CLIInfoCommand.execute(machine, parsed)
+        if not parsed.quiet:
+            CLIInfoCommand.execute(machine, parsed)
 
         # get info about docker endpoint
-        CLIEndpointInfoCommand.execute(machine, parsed)
+        if not parsed.quiet:
+            CLIEndpointInfoCommand.execute(machine, parsed)
 
         # pick right value of `arch` given endpoint
         if parsed.arch is None:
@@ -65,18 +67,39 @@ class CLIPullCommand(AbstractCLICommand):
                 project.docker.image.release_name(parsed.arch).compile()
             ]
 
+        # registry the images are exchanged with
+        registry: str = project.docker.registry.compile(True)
+
+        # print info about registry
         for image in images:
-            # print info about registry
-            msg = "Pulling image {} from {}.".format(image, project.docker.registry.compile(True))
+            msg = "Pulling image {} from {}.".format(image, registry)
             cpklogger.info(msg)
-            # pull image
+
+        def _pull(image: str, progress: bool) -> bool:
             try:
-                machine.pull_image(image, progress=True)
+                machine.pull_image(image, progress=progress)
             except dockertown.exceptions.DockerException as e:
                 cpklogger.error(f"An error occurred while pulling the project image:\n{str(e)}")
                 return False
             except CPKProjectPullException:
                 cpklogger.error(f"An error occurred while pulling the project image.")
                 return False
+            return True
+
+        # pull images
+        if len(images) == 1:
+            if not _pull(images[0], progress=True):
+                return False
+        else:
+            # pull in parallel, progress bars would interleave when pulling more than one
+            executor = ThreadPoolExecutor(max_workers=len(images))
+            futures = {executor.submit(_pull, image, progress=False): image for image in images}
+            for future in as_completed(futures):
+                if not future.result():
+                    # do not wait for the other pulls before reporting the error
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return False
+                cpklogger.info(f"Image {futures[future]} pulled.")
+            executor.shutdown()
 
         cpklogger.info("Image pulled successfully!")
@@ -6,8 +6,7 @@ from dockertown.exceptions import NoSuchImage, DockerException
 from .endpoint import CLIEndpointInfoCommand
 from .info import CLIInfoCommand
 from .. import AbstractCLICommand, cpklogger
-from ..utils import combine_args
-from ... import CPKProject
+from ..utils import combine_args, get_project
 from ...exceptions import CPKProjectPushException
 from ...types import CPKMachine, Arguments
 from ...utils.git import check_git_status
@@ -47,10 +46,11 @@ class CLIPushCommand(AbstractCLICommand):
         parsed = combine_args(parsed, kwargs)
         # ---
         # get project
-        project = CPKProject(parsed.workdir)
+        project = get_project(parsed)
 
         # show info about project
-        CLIInfoCommand.execute(machine, parsed)
+        if not parsed.quiet:
+            CLIInfoCommand.execute(machine, parsed)
 
         # check git workspace status
         proceed = check_git_status(project, parsed)
@@ -58,7 +58,8 @@ class CLIPushCommand(AbstractCLICommand):
             return False
 
         # get info about docker endpoint
-        CLIEndpointInfoCommand.execute(machine, parsed)
+        if not parsed.quiet:
+            CLIEndpointInfoCommand.execute(machine, parsed)
 
         # pick right value of `arch` given endpoint
         if parsed.arch is None:
@@ -80,9 +81,12 @@ class CLIPushCommand(AbstractCLICommand):
         # hook: pre-push
         project.trigger("pre-push")
 
+        # registry the images are exchanged with
+        registry: str = project.docker.registry.compile(True)
+
         for image in images:
             # print info about registry
-            msg = "Pushing image {} to {}.".format(image, project.docker.registry.compile(True))
+            msg = "Pushing image {} to {}.".format(image, registry)
             cpklogger.info(msg)
             # push image
             try:
@@ -1,10 +1,16 @@
 import argparse
+import ipaddress
+import logging
 import os
-import random
+import secrets
+import shlex
 import shutil
-import string
+import socket
 import subprocess
-from typing import Optional, Set, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import PurePosixPath
+from typing import Optional, Set, List, Tuple
 
 import cpk.cli
 import dockertown.exceptions
@@ -16,7 +22,7 @@ from .endpoint import CLIEndpointInfoCommand
 from .info import CLIInfoCommand
 from .. import AbstractCLICommand
 from ..logger import cpklogger
-from ..utils import combine_args, pretty_json
+from ..utils import combine_args, pretty_json, get_project
 from ...exceptions import NotACPKProjectException
 from ...types import CPKMachine, Arguments, DockertownContainerConfiguration
 
@@ -141,13 +147,15 @@ class CLIRunCommand(AbstractCLICommand):
         parsed = combine_args(parsed, kwargs)
         # ---
         # get project
-        project = CPKProject(parsed.workdir)
+        project = get_project(parsed)
 
         # show info about project
-        CLIInfoCommand.execute(machine, parsed)
+        if not parsed.quiet:
+            CLIInfoCommand.execute(machine, parsed)
 
         # get info about docker endpoint
-        CLIEndpointInfoCommand.execute(machine, parsed, quiet=True)
+        if not parsed.quiet:
+            CLIEndpointInfoCommand.execute(machine, parsed, quiet=True)
 
         # pick right value of `arch` given endpoint
         machine_arch: str = machine.get_architecture()
@@ -157,18 +165,31 @@ class CLIRunCommand(AbstractCLICommand):
             cpklogger.info(f"Parameter `arch` automatically set to `{parsed.arch}`.")
 
         # check runtime
-        if parsed.runtime is not None and shutil.which(parsed.runtime) is None:
+        if parsed.runtime is not None and _which(parsed.runtime) is None:
             raise ValueError('Docker runtime binary "{}" not found!'.format(parsed.runtime))
 
         # check other projects to mount
-        projects_to_mount: List[CPKProject] = []
-        for p in (parsed.mount or []):
+        paths_to_mount: List[str] = list(dict.fromkeys(parsed.mount or []))
+        for p in paths_to_mount:
             if not os.path.isdir(p):
                 cpklogger.error('The path "{:s}" is not a CPK project'.format(p))
                 return False
+
+        def _load_project(path: str) -> Tuple[Optional[CPKProject], Optional[Exception]]:
             try:
-                proj: CPKProject = CPKProject(p)
-            except NotACPKProjectException:
+                return get_project(parsed, path), None
+            except NotACPKProjectException as e:
+                return None, e
+
+        # load projects to mount (in parallel when there is more than one)
+        if len(paths_to_mount) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths_to_mount))) as executor:
+                loaded = list(executor.map(_load_project, paths_to_mount))
+        else:
+            loaded = list(map(_load_project, paths_to_mount))
+        projects_to_mount: List[CPKProject] = []
+        for p, (proj, error) in zip(paths_to_mount, loaded):
+            if error is not None:
                 cpklogger.error(f"The path '{p}' does not contain a CPK project.")
                 return False
             projects_to_mount.append(proj)
@@ -199,7 +220,7 @@ class CLIRunCommand(AbstractCLICommand):
         # - launcher trigger
         if parsed.launcher:
             triggers.update({f"run:launcher:{parsed.launcher}"})
-        cpklogger.debug(f"Active triggers: {triggers}")
+        cpklogger.debug("Active triggers: %s", triggers)
 
         # configure multiarch (if needed)
         cpklogger.info("Running an image for {} on {}.".format(parsed.arch, machine_arch))
@@ -215,7 +236,7 @@ class CLIRunCommand(AbstractCLICommand):
                 cpklogger.warning("You are not using an SSH machine. Project syncing will not be possible.")
                 sync_remote = False
             # make sure rsync is installed
-            if shutil.which("rsync") is None:
+            if _which("rsync") is None:
                 cpklogger.warning("Project synchronization with a remote machine requires the 'rsync' "
                                   "tool to be installed. Please, install it to enable remote sync.")
                 sync_remote = False
@@ -242,7 +263,7 @@ class CLIRunCommand(AbstractCLICommand):
         configuration.image = project.docker.image.name(parsed.arch).compile()
 
         # container name
-        random_str = ''.join(random.choice(string.ascii_lowercase) for _ in range(8))
+        random_str = secrets.token_hex(4)
         container_name: str = f"cpk-run-{project.name.replace('/', '-')}-{random_str}"
         configuration.name = container_name
 
@@ -279,23 +300,55 @@ class CLIRunCommand(AbstractCLICommand):
 
         # sync
         if sync_remote:
-            cpklogger.info(f"Syncing project...")
+            # only sync if source is not absolute
+            rsync_sources: List[str] = [
+                host_path for host_path, container_path, *_ in configuration.volumes
+                if not os.path.isabs(host_path)
+            ]
+            sync_remote = len(rsync_sources) > 0
+        if sync_remote:
+            cpklogger.info(f"Syncing {len(rsync_sources)} mountpoint(s)...")
             remote_base = f"{machine.user}@{machine.host}"
-            for host_path, container_path, *_ in configuration.volumes:
-                # only sync if source is not absolute
-                if os.path.isabs(host_path):
-                    continue
+            # destination paths live on the remote (Linux) machine
+            rsync_root: PurePosixPath = PurePosixPath(RSYNC_DESTINATION_PATH, project.name)
+            # rsync options
+            rsync_options: List[str] = ["--archive", "--delete"]
+            # on a LAN, bandwidth is cheaper than computing deltas and compressing them
+            if _is_private_host(machine.host):
+                rsync_options.append("--whole-file")
+            else:
+                rsync_options.append("--compress")
+            # each mountpoint is synced to `rsync_root / host_path` on the remote machine
+            cwd: str = os.getcwd()
+            rsync_paths: List[str] = []
+            rsync_outside: List[Tuple[str, PurePosixPath]] = []
+            for host_path in rsync_sources:
                 rsync_source: str = os.path.abspath(host_path)
-                rsync_destination: str = os.path.join(
-                    RSYNC_DESTINATION_PATH, project.name, host_path.lstrip("/")
-                )
-                # rsync options
-                rsync_options = f"--archive --delete --rsync-path=\"mkdir -p {rsync_destination} && rsync\""
-                # run rsync
-                remote_path = f"{remote_base}:{rsync_destination}".rstrip('/') + '/'
-                cpklogger.info(f"Syncing mountpoint [{rsync_source}] -> [{remote_path}]")
-                cmd = f"rsync {rsync_options} {rsync_source}/ {remote_path}"
-                _run_cmd(cmd, shell=True)
+                rsync_destination: PurePosixPath = rsync_root / host_path
+                cpklogger.info(f"Syncing mountpoint [{rsync_source}] -> "
+                               f"[{remote_base}:{rsync_destination}/]")
+                rsync_path: str = os.path.relpath(rsync_source, cwd)
+                if rsync_path.split(os.sep)[0] == os.pardir:
+                    rsync_outside.append((rsync_source, rsync_destination))
+                else:
+                    # the `/./` marker tells rsync (--relative) which part of the path to recreate
+                    rsync_paths.append(f"{cwd}/./{rsync_path}/")
+            # mountpoints inside the current directory are transferred by a single rsync
+            if rsync_paths:
+                cmd = [
+                    "rsync", *rsync_options, "--relative",
+                    f"--rsync-path=mkdir -p {rsync_root} && rsync",
+                    *rsync_paths, f"{remote_base}:{rsync_root}/"
+                ]
+                _run_cmd(cmd)
+            # mountpoints outside of it cannot be recreated by --relative, they get their own rsync
+            for rsync_source, rsync_destination in rsync_outside:
+                cmd = [
+                    "rsync", *rsync_options,
+                    f"--rsync-path=mkdir -p {rsync_destination} && rsync",
+                    f"{rsync_source}/", f"{remote_base}:{rsync_destination}/"
+                ]
+                _run_cmd(cmd)
             cpklogger.info(f"Project synced!")
 
         # x-docker configuration
@@ -359,8 +412,10 @@ class CLIRunCommand(AbstractCLICommand):
         #         if not success:
         #             return False
 
-        # print out configuration
-        cpklogger.debug(f"Container configuration:\n{pretty_json(configuration.compile(project), 4)}")
+        # print out configuration (compiling it is not free, only when it is going to be shown)
+        if cpklogger.isEnabledFor(logging.DEBUG):
+            compiled: dict = configuration.compile(project)
+            cpklogger.debug(f"Container configuration:\n{pretty_json(compiled, 4)}")
 
         # run
         cpklogger.info(f"Running container '{configuration.name}'...")
@@ -376,30 +431,36 @@ class CLIRunCommand(AbstractCLICommand):
             cpklogger.info("Your container is running in detached mode!")
 
 
+@lru_cache(maxsize=None)
+def _which(executable: str) -> Optional[str]:
+    return shutil.which(executable)
+
+
+def _is_private_host(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_private
+    except (socket.error, ValueError):
+        return False
+
+
 def _run_cmd(cmd, get_output=False, print_output=False, suppress_errors=False, shell=False,
              return_exitcode=False):
-    if shell and isinstance(cmd, (list, tuple)):
-        cmd = " ".join([str(s) for s in cmd])
-    cpklogger.debug("$ %s" % cmd)
+    if cpklogger.isEnabledFor(logging.DEBUG):
+        cpklogger.debug("$ %s", shlex.join(cmd) if isinstance(cmd, (list, tuple)) else cmd)
     if get_output:
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, shell=shell)
-        proc.wait()
-        if proc.returncode != 0:
+        res = subprocess.run(cmd, shell=shell, capture_output=True)
+        if res.returncode != 0:
             if not suppress_errors:
-                msg = "The command {} returned exit code {}".format(cmd, proc.returncode)
+                msg = "The command {} returned exit code {}".format(cmd, res.returncode)
+                if res.stderr:
+                    msg += ". The error reads:\n{}".format(res.stderr.decode("utf-8").rstrip())
                 cpklogger.error(msg)
                 raise RuntimeError(msg)
-        out = proc.stdout.read().decode("utf-8").rstrip()
+        out = res.stdout.decode("utf-8").rstrip()
         if print_output:
             print(out)
         return out
     else:
+        res = subprocess.run(cmd, shell=shell, check=not (suppress_errors or return_exitcode))
         if return_exitcode:
-            res = subprocess.run(cmd, shell=shell)
             return res.returncode
-        else:
-            try:
-                subprocess.check_call(cmd, shell=shell)
-            except subprocess.CalledProcessError as e:
-                if not suppress_errors:
-                    raise e
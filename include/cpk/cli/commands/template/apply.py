@@ -1,8 +1,7 @@
 import argparse
+import sys
 from functools import partial
-from typing import Optional, Callable
-
-import questionary
+from typing import Optional, Callable, List
 
 from cpk import CPKProject, CPKTemplate
 
@@ -11,6 +10,13 @@ from cpk.cli.utils import combine_args
 from cpk.template import CPKProjectDiff
 from cpk.types import CPKMachine, Arguments
 
+# colors used to print the diff
+color: Callable[[str, str], str] = lambda c, x: f"\033[{c}m{x}\033[0m"
+red: Callable[[str], str] = partial(color, "31")
+orange: Callable[[str], str] = partial(color, "33")
+white: Callable[[str], str] = partial(color, "37")
+blue: Callable[[str], str] = partial(color, "34")
+
 
 class CLITemplateApplyCommand(AbstractCLICommand):
 
@@ -46,12 +52,6 @@ class CLITemplateApplyCommand(AbstractCLICommand):
         # compute diff
         diff: CPKProjectDiff = template.diff(project)
         # print diff
-        color: Callable[[str], str] = lambda c, x: f"\033[{c}m{x}\033[0m"
-        red: Callable[[str], str] = partial(color, "31")
-        orange: Callable[[str], str] = partial(color, "33")
-        white: Callable[[str], str] = partial(color, "37")
-        blue: Callable[[str], str] = partial(color, "34")
-        # ---
         print(f"Comparing Template:{white(diff.left)} with Project:{white(diff.right)}")
         # ---
         # make sure there is something to do
@@ -60,14 +60,15 @@ class CLITemplateApplyCommand(AbstractCLICommand):
             return True
         # ---
         sep: str = "\n\t- "
+        report: List[str] = []
         # - different files
         if diff.files_changed:
-            print(f"\nThe following files will be overwritten:"
-                  f"{blue(f'{sep}{sep.join(diff.files_changed)}')}")
+            report.append(f"\nThe following files will be overwritten:"
+                          f"{blue(f'{sep}{sep.join(diff.files_changed)}')}")
         # - missing files
         if diff.template_only:
-            print(f"\nThe following files and directories will be created:"
-                  f"{red(f'{sep}{sep.join(diff.template_only)}')}")
+            report.append(f"\nThe following files and directories will be created:"
+                          f"{red(f'{sep}{sep.join(diff.template_only)}')}")
         # ask the user if they want to proceed
         warnings: str = "\n" + "-" * 32 + orange("\n".join([
             "",
@@ -76,7 +77,12 @@ class CLITemplateApplyCommand(AbstractCLICommand):
             "         - If you want to keep them, please commit them first.",
             "         - Unless you are using a version control system, you will not be able to recover them."
         ]))
-        print(warnings)
+        report.append(warnings)
+        # print the whole report at once
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
+        # questionary (and prompt_toolkit) are only loaded when there is something to confirm
+        import questionary
         if questionary.confirm(f"Proceed?").ask():
             # apply template
             diff.apply(dry_run=parsed.dry_run)
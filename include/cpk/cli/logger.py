@@ -28,14 +28,19 @@ filename_lineno = colored("%(filename)15s:%(lineno)-4s", "blue")
 format = f"%(name)3s|{filename_lineno} - %(funcName)-15s : %(message)s" \
     if DEBUG else f"%(name)3s|{levelname} : %(message)s"
 indent = " " * (43 if DEBUG else 13)
+newline = f"\n{indent}: "
+
+# colors indexed by level name as it appears in the log records
+level_colors = {level.upper(): color for level, color in colors.items()}
 
 
 class CustomFilter(logging.Filter):
     def filter(self, record):
-        lines = record.msg.split("\n")
-        color = colors[record.levelname.lower()]
-        lines = map(lambda l: colored(l, color) if color else l, lines)
-        record.msg = f"\n{indent}: ".join(lines)
+        color = level_colors[record.levelname]
+        if color:
+            record.msg = newline.join(colored(line, color) for line in record.msg.split("\n"))
+        elif "\n" in record.msg:
+            record.msg = record.msg.replace("\n", newline)
         return super(CustomFilter, self).filter(record)
 
 
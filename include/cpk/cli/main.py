@@ -1,41 +1,39 @@
 import argparse
 import copy
+import importlib
 import logging
 import os
 import sys
+from typing import Type
 
 import cpk
 from cpk import cpkconfig
-from cpk.cli.commands.build import CLIBuildCommand
-from cpk.cli.commands.clean import CLICleanCommand
-from cpk.cli.commands.create import CLICreateCommand
-from cpk.cli.commands.decorate import CLIDecorateCommand
-from cpk.cli.commands.endpoint import CLIEndpointCommand
-from cpk.cli.commands.template import CLITemplateCommand
-from cpk.cli.commands.info import CLIInfoCommand
-from cpk.cli.commands.machine import CLIMachineCommand
-from cpk.cli.commands.pull import CLIPullCommand
-from cpk.cli.commands.push import CLIPushCommand
-from cpk.cli.commands.run import CLIRunCommand
+from cpk.cli import AbstractCLICommand
 from cpk.cli.logger import cpklogger, update_logger
 from cpk.exceptions import CPKException
 from cpk.utils.machine import get_machine
 
+# commands are imported only when selected, this keeps the startup of the CLI fast
 _supported_commands = {
-    'create': CLICreateCommand,
-    'info': CLIInfoCommand,
-    'build': CLIBuildCommand,
-    'run': CLIRunCommand,
-    'clean': CLICleanCommand,
-    'push': CLIPushCommand,
-    'pull': CLIPullCommand,
-    'decorate': CLIDecorateCommand,
-    'machine': CLIMachineCommand,
-    'endpoint': CLIEndpointCommand,
-    'template': CLITemplateCommand,
+    'create': ('cpk.cli.commands.create', 'CLICreateCommand'),
+    'info': ('cpk.cli.commands.info', 'CLIInfoCommand'),
+    'build': ('cpk.cli.commands.build', 'CLIBuildCommand'),
+    'run': ('cpk.cli.commands.run', 'CLIRunCommand'),
+    'clean': ('cpk.cli.commands.clean', 'CLICleanCommand'),
+    'push': ('cpk.cli.commands.push', 'CLIPushCommand'),
+    'pull': ('cpk.cli.commands.pull', 'CLIPullCommand'),
+    'decorate': ('cpk.cli.commands.decorate', 'CLIDecorateCommand'),
+    'machine': ('cpk.cli.commands.machine', 'CLIMachineCommand'),
+    'endpoint': ('cpk.cli.commands.endpoint', 'CLIEndpointCommand'),
+    'template': ('cpk.cli.commands.template', 'CLITemplateCommand'),
 }
 
 
+def _get_command(name: str) -> Type[AbstractCLICommand]:
+    module, cls = _supported_commands[name]
+    return getattr(importlib.import_module(module), cls)
+
+
 def run():
     cpklogger.info(f"CPK - Code Packaging toolKit - v{cpk.__version__}")
     parser = argparse.ArgumentParser(add_help=False)
@@ -66,7 +64,7 @@ def run():
     # parse `command`
     parsed, remaining = parser.parse_known_args()
     # get command
-    command = _supported_commands[parsed.command]
+    command = _get_command(parsed.command)
     # let the command parse its arguments
     cmd_parser = command.get_parser(remaining)
     parsed = cmd_parser.parse_args(remaining)
@@ -1,26 +1,35 @@
 import argparse
 import json
+import os
 import traceback
-from typing import Any
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from functools import partial
 from typing import Callable
 
+if TYPE_CHECKING:
+    from cpk import CPKProject
+
+
+def _find_argument(parser: argparse.ArgumentParser, arg: str) -> Optional[argparse.Action]:
+    for action in parser._actions:
+        opts = action.option_strings
+        if (opts and opts[0] == arg) or action.dest == arg:
+            return action
+    return None
+
 
 def remove_argument(parser: argparse.ArgumentParser, arg: str, suppress_errors: bool = True):
     try:
-        for action in parser._actions:
-            opts = action.option_strings
-            if (opts and opts[0] == arg) or action.dest == arg:
-                parser._remove_action(action)
-                break
-
-        for action in parser._action_groups:
-            for group_action in action._group_actions:
-                opts = group_action.option_strings
-                if (opts and opts[0] == arg) or group_action.dest == arg:
-                    action._group_actions.remove(group_action)
-                    return
+        action = _find_argument(parser, arg)
+        if action is None:
+            return
+        parser._remove_action(action)
+        # the same action object is also listed in the group it belongs to
+        for group in parser._action_groups:
+            if action in group._group_actions:
+                group._group_actions.remove(action)
+                return
     except Exception as e:
         if not suppress_errors:
             raise e
@@ -28,33 +37,45 @@ def remove_argument(parser: argparse.ArgumentParser, arg: str, suppress_errors:
 
 def hide_argument(parser: argparse.ArgumentParser, arg: str, suppress_errors: bool = True):
     try:
-        for action in parser._actions:
-            opts = action.option_strings
-            if (opts and opts[0] == arg) or action.dest == arg:
-                action.help = argparse.SUPPRESS
-                break
-
-        for action in parser._action_groups:
-            for group_action in action._group_actions:
-                opts = group_action.option_strings
-                if (opts and opts[0] == arg) or group_action.dest == arg:
-                    action.help = argparse.SUPPRESS
-                    return
+        action = _find_argument(parser, arg)
+        if action is not None:
+            action.help = argparse.SUPPRESS
     except Exception as e:
         if not suppress_errors:
             raise e
 
 
 def combine_args(parsed: argparse.Namespace, kwargs: dict) -> argparse.Namespace:
-    # combine arguments
-    for k, v in kwargs.items():
-        parsed.__setattr__(k, v)
+    # combine arguments (in place)
+    vars(parsed).update(kwargs)
     # ---
     return parsed
 
 
+class _ProjectsCache(dict):
+
+    def __deepcopy__(self, memo):
+        # copies of the parsed arguments (e.g., build -> push) belong to the same invocation
+        return self
+
+
+def get_project(parsed: argparse.Namespace, path: Optional[str] = None) -> 'CPKProject':
+    from cpk import CPKProject
+    # projects are loaded once per invocation and shared by all the commands it runs, the
+    # cache lives on the parsed arguments so that a new invocation sees the current git state,
+    # callers get the same instance every time and must not modify it
+    path = os.path.abspath(parsed.workdir if path is None else path)
+    projects: Dict[str, 'CPKProject'] = vars(parsed).setdefault("_projects", _ProjectsCache())
+    if path not in projects:
+        projects[path] = CPKProject(path)
+    return projects[path]
+
+
 def indent_block(s: str, indent_len: int = 4) -> str:
     space: str = " " * indent_len
+    # printable strings cannot contain line boundaries, nothing to split
+    if s is not None and s.isprintable():
+        return space + s
     return space + f"\n{space}".join(s.splitlines() if s is not None else ["None"])
 
 
@@ -79,12 +100,8 @@ def as_table(data: dict, title: str, indent_len: int = 2) -> str:
 {{content}}
 {'-' * width}
     """
-    row: str = "{s}{w}{key}:{x} {value}"
     # produce content
-    content: str = ""
-    for k, v in data.items():
-        content += row.format(s=space, w=w, x=x, key=k, value=v) + "\n"
-    content = content.strip("\n")
+    content: str = "\n".join(f"{space}{w}{k}:{x} {v}" for k, v in data.items()).strip("\n")
     # ---
     return table.format(content=content)
 
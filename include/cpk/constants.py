@@ -1,5 +1,4 @@
 import os
-from pathlib import Path
 
 
 DEBUG = False
@@ -38,7 +37,7 @@ DEFAULT_DOCKER_REGISTRY_PORT = 5000
 DEFAULT_DOCKER_ORGANIZATION = "library"
 DEFAULT_DOCKER_TAG = "latest"
 
-CPK_CONFIG_DIR = os.path.abspath(os.path.join(str(Path.home()), ".cpk"))
+CPK_CONFIG_DIR = os.path.abspath(os.path.expanduser(os.path.join("~", ".cpk")))
 
 DOCKERHUB_API_URL = {
     "token": "https://auth.docker.io/token?scope=repository:{image}:pull&"
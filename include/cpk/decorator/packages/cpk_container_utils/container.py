@@ -13,21 +13,23 @@ if 'DEBUG' in os.environ and os.environ['DEBUG'].lower() in ['true', 'yes', '1']
 
 def get_container_health():
     health = "ND"
-    if os.path.isfile(HEALTH_FILE):
-        try:
-            with open(HEALTH_FILE, 'rt') as fin:
-                health = fin.read().strip('\n').strip(' ')
-        except BaseException:
-            logger.warning('An error occurred while trying to fetch the container\'s health.')
+    # open the file directly (no stat), a missing file means the health is not defined yet
+    try:
+        with open(HEALTH_FILE, 'rt') as fin:
+            health = fin.read().strip('\n').strip(' ')
+    except (FileNotFoundError, IsADirectoryError):
+        pass
+    except BaseException:
+        logger.warning('An error occurred while trying to fetch the container\'s health.')
     return health
 
 
 def _set_container_health(new_health):
-    health = get_container_health()
     if new_health not in ['healthy', 'unhealthy']:
         logger.warning('Health "{0}" not recognized!'.format(new_health))
         return
     # ---
+    health = get_container_health()
     if health == new_health:
         return
     logger.info('Updating container health [{0}] -> [{1}]'.format(health, new_health))
@@ -11,10 +11,14 @@ class CPKException(RuntimeError):
 class NotACPKProjectException(CPKException):
 
     def __init__(self, path: str):
-        super(NotACPKProjectException, self).__init__(
-            f"The path '{path}' does not appear to be a CPK project. " +
+        super(NotACPKProjectException, self).__init__(path)
+        self.path = path
+
+    def __str__(self) -> str:
+        # the message needs to look at the disk, build it only when it is shown
+        return f"The path '{self.path}' does not appear to be a CPK project. " + \
             (f"The metadata file 'cpk/self.yaml' is missing."
-             if os.path.isdir(path) else "Path does not exist."))
+             if os.path.isdir(self.path) else "Path does not exist.")
 
 
 class DeprecatedCPKProjectFormat1Exception(CPKException):
@@ -13,11 +13,6 @@ from cpk.exceptions import CPKException
 
 from cpk.types import CPKMachine
 
-from cryptography.hazmat.primitives import serialization as crypto_serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.backends import default_backend as crypto_default_backend
-from sshconf import empty_ssh_config_file
-
 from cpk.utils.misc import configure_ssh_for_cpk
 
 
@@ -31,7 +26,9 @@ class FromEnvMachine(CPKMachine):
         return True
 
     def get_client(self) -> DockerClient:
-        return DockerClient()
+        if self._client is None:
+            self._client = DockerClient()
+        return self._client
 
 
 class TCPMachine(CPKMachine):
@@ -50,10 +47,12 @@ class TCPMachine(CPKMachine):
         return hostname in ["tcp://localhost", "tcp://127.0.0.1", "tcp://127.0.1.1"]
 
     def get_client(self) -> DockerClient:
-        try:
-            return DockerClient(host=self.base_url)
-        except dockertown.exceptions.DockerException as e:
-            raise CPKException(str(e))
+        if self._client is None:
+            try:
+                self._client = DockerClient(host=self.base_url)
+            except dockertown.exceptions.DockerException as e:
+                raise CPKException(str(e))
+        return self._client
 
 
 class UnixSocketMachine(TCPMachine):
@@ -104,10 +103,17 @@ class SSHMachine(CPKMachine):
         return f"ssh://{self.uri}:{self.port}"
 
     def get_client(self) -> DockerClient:
-        return DockerClient(host=self.base_url)
+        if self._client is None:
+            self._client = DockerClient(host=self.base_url)
+        return self._client
 
     def save(self, logger: Optional[logging.Logger] = None):
         from cpk import cpkconfig
+        # key generation and SSH configuration are only needed when a machine is created
+        from cryptography.hazmat.primitives import serialization as crypto_serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        from cryptography.hazmat.backends import default_backend as crypto_default_backend
+        from sshconf import empty_ssh_config_file
         path = os.path.join(cpkconfig.path, "machines", self.name)
         # make sure the tool `ssh-copy-id` is present
         ssh_copy_id = which("ssh-copy-id")
@@ -181,6 +187,13 @@ class SSHMachine(CPKMachine):
         self.remove(logger=logger)
         raise RuntimeError("RSA keys could not be copied to the destination machine.")
 
+    @property
+    def control_path(self) -> str:
+        from cpk import cpkconfig
+        # sockets must live outside of .cpk/ssh, everything in there is included by the user's
+        # SSH configuration, and SSH refuses to start when it finds a socket in there
+        return os.path.join(cpkconfig.path, "ssh-mux", "%C")
+
     def __enter__(self):
         from cpk import cpkconfig
         # create SSH host configuration file in the SSH pool directory .cpk/ssh
@@ -188,9 +201,20 @@ class SSHMachine(CPKMachine):
         host_cfg_src_fpath = os.path.join(self.config_path, "host.conf")
         host_cfg_dest_fpath = os.path.join(cpk_ssh_pool_dir, f"{self.name}.conf")
         shutil.copy(host_cfg_src_fpath, host_cfg_dest_fpath)
+        # share a single SSH connection among all the SSH sessions (docker, rsync, ...)
+        # opened against this machine while it is in use
+        os.makedirs(os.path.dirname(self.control_path), mode=0o700, exist_ok=True)
+        with open(host_cfg_dest_fpath, "at") as fout:
+            fout.write(
+                f"  ControlMaster auto\n"
+                f"  ControlPath \"{self.control_path}\"\n"
+                f"  ControlPersist 60\n"
+            )
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         from cpk import cpkconfig
+        # the shared SSH connection is not closed here, other cpk processes might be using it,
+        # it closes by itself once it has been idle for `ControlPersist` seconds
         # remove SSH host configuration file from the SSH pool directory .cpk/ssh
         cpk_ssh_pool_dir = os.path.join(cpkconfig.path, "ssh")
         host_cfg_fpath = os.path.join(cpk_ssh_pool_dir, f"{self.name}.conf")
@@ -3,6 +3,7 @@ import dataclasses
 import json
 import logging
 import os
+import posixpath
 import re
 import subprocess
 from abc import abstractmethod, ABC
@@ -11,14 +12,15 @@ from datetime import timedelta
 from enum import Enum
 from shutil import rmtree
 from tempfile import TemporaryDirectory
-from typing import List, Dict, Optional, Union, Type, Iterator, Any, Tuple, ContextManager
+from typing import List, Dict, Optional, Union, Type, Iterator, Any, Tuple, ContextManager, \
+    Mapping
 
 from dacite import from_dict, Config
 from mergedeep import merge, Strategy
 
 import cpk
 from cpk.utils.misc import assert_canonical_arch
-from dockertown import Image, DockerClient
+from dockertown import Image, DockerClient, SystemInfo
 from dockertown.components.container.cli_wrapper import ValidPortMapping, Container, ValidContainer
 from dockertown.components.image.cli_wrapper import ValidImage
 from dockertown.components.network.cli_wrapper import ValidNetwork
@@ -466,10 +468,24 @@ class DockertownContainerConfiguration:
             # replace other fields
             if theirs is not None:
                 self.set(field.name, theirs)
+        from cpk.cli.logger import cpklogger
         # convert relative paths in volumes to absolute paths
         abs = lambda p: os.path.abspath(p if os.path.isabs(p) else os.path.join(project.path, p))
-        new_volumes: List[BindMountDefinition] = [(abs(v[0]), *v[1:]) for v in config.volumes]
-        self.volumes += new_volumes
+        # docker does not allow two bind mounts with the same destination, the first one wins
+        # (e.g., the same project mounted twice, once as '.' and once with its absolute path)
+        mounted: Dict[str, tuple] = {}
+        for volume in self.volumes:
+            mounted.setdefault(posixpath.normpath(volume[1]), (abs(volume[0]), *volume[2:]))
+        for volume in config.volumes:
+            source, destination, *mode = volume
+            destination = posixpath.normpath(destination)
+            if destination in mounted:
+                if mounted[destination] != (abs(source), *mode):
+                    cpklogger.warning(f"Destination '{destination}' is already mounted from "
+                                      f"'{mounted[destination][0]}', ignoring source '{source}'.")
+                continue
+            mounted[destination] = (abs(source), *mode)
+            self.volumes.append((abs(source), *volume[1:]))
         # named volumes are merged as well as long as they are not already defined
         for name, volume in config._named_volumes.items():
             if name in self._named_volumes:
@@ -958,6 +974,8 @@ class CPKMachine(ABC):
         self._configuration = configuration or {}
         # cache
         self._arch = None
+        self._info = None
+        self._client = None
 
     @property
     def name(self) -> str:
@@ -1015,13 +1033,16 @@ class CPKMachine(ABC):
         if os.path.exists(path):
             rmtree(path)
 
+    def get_info(self) -> SystemInfo:
+        if self._info is None:
+            self._info = self.get_client().info()
+        return self._info
+
     def get_architecture(self) -> str:
         if self._arch is not None:
             return self._arch
-        # get client
-        client = self.get_client()
-        # fetch architecture from client
-        endpoint_arch = client.info().architecture
+        # fetch architecture from endpoint
+        endpoint_arch = self.get_info().architecture
         if endpoint_arch not in CANONICAL_ARCH:
             raise CPKException(f"Unsupported architecture '{endpoint_arch}'.")
         self._arch = CANONICAL_ARCH[endpoint_arch]
@@ -1030,7 +1051,7 @@ class CPKMachine(ABC):
     def get_ncpus(self, ) -> Optional[int]:
         # noinspection PyBroadException
         try:
-            return self.get_client().info()["NCPU"]
+            return self.get_info()["NCPU"]
         except BaseException:
             return None
 
@@ -1065,4 +1086,4 @@ Machine:
 @dataclasses.dataclass
 class CPKConfiguration:
     path: str
-    machines: Dict[str, CPKMachine]
+    machines: Mapping[str, CPKMachine]
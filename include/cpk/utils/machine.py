@@ -1,9 +1,7 @@
 import argparse
-import glob
 import json
 import os
-from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, List, Mapping, Optional
 
 import jsonschema
 
@@ -20,52 +18,95 @@ _supported_machines = {
 }
 
 
-def load_machines(path: str) -> Dict[str, CPKMachine]:
-    machines = {}
-    # iterate over the machines on disk
-    for machine_cfg_fpath in glob.glob(os.path.join(path, '*/config.json')):
-        machine_dir = Path(machine_cfg_fpath).parent
-        machine_name = machine_dir.stem
-        try:
-            with open(machine_cfg_fpath, 'rt') as fin:
-                try:
-                    machine_cfg = json.load(fin)
-                except json.decoder.JSONDecodeError as e:
-                    raise ValueError(f"Machine descriptor file is not a valid JSON file. "
-                                     f"Reason:\n\t{str(e)}")
-                # make sure the key 'version' is present
-                if "version" not in machine_cfg:
-                    raise KeyError("Missing field 'version'.")
-                # try reading the schema for this version
-                try:
-                    schema = get_machine_schema(machine_cfg["version"])
-                except FileNotFoundError:
-                    raise KeyError(f"Machine descriptor version '{machine_cfg['version']}' "
-                                   f"not supported.")
-                # validate config file
-                try:
-                    jsonschema.validate(machine_cfg, schema=schema)
-                except jsonschema.exceptions.ValidationError as e:
-                    raise ValueError(f"Machine descriptor has a bad format. "
-                                     f"Reason:\n\t{str(e.message)}")
-                # machine is valid, create object
-                machine_cls = _supported_machines[machine_cfg["type"]]
-                try:
-                    machine = machine_cls(name=machine_name, **machine_cfg["configuration"])
-                except TypeError as e:
-                    raise ValueError(f"Machine descriptor has a bad format. "
-                                     f"Reason:\n\t{str(e)}")
-        except (KeyError, ValueError) as e:
-            cpklogger.warning(f"An error occurred while loading the machine '{machine_name}', "
-                              f"the error reads:\n{str(e)}")
-            continue
-        # we have loaded a valid machine
-        machines[machine_name] = machine
-    # ---
-    return machines
-
-
-def get_machine(parsed: argparse.Namespace, machines: Dict[str, CPKMachine]) -> CPKMachine:
+def load_machine(path: str, name: str) -> Optional[CPKMachine]:
+    machine_cfg_fpath = os.path.join(path, name, "config.json")
+    try:
+        with open(machine_cfg_fpath, 'rt') as fin:
+            try:
+                machine_cfg = json.load(fin)
+            except json.decoder.JSONDecodeError as e:
+                raise ValueError(f"Machine descriptor file is not a valid JSON file. "
+                                 f"Reason:\n\t{str(e)}")
+            # make sure the key 'version' is present
+            if "version" not in machine_cfg:
+                raise KeyError("Missing field 'version'.")
+            # try reading the schema for this version
+            try:
+                schema = get_machine_schema(machine_cfg["version"])
+            except FileNotFoundError:
+                raise KeyError(f"Machine descriptor version '{machine_cfg['version']}' "
+                               f"not supported.")
+            # validate config file
+            try:
+                jsonschema.validate(machine_cfg, schema=schema)
+            except jsonschema.exceptions.ValidationError as e:
+                raise ValueError(f"Machine descriptor has a bad format. "
+                                 f"Reason:\n\t{str(e.message)}")
+            # machine is valid, create object
+            machine_cls = _supported_machines[machine_cfg["type"]]
+            try:
+                return machine_cls(name=name, **machine_cfg["configuration"])
+            except TypeError as e:
+                raise ValueError(f"Machine descriptor has a bad format. "
+                                 f"Reason:\n\t{str(e)}")
+    except (KeyError, ValueError) as e:
+        cpklogger.warning(f"An error occurred while loading the machine '{name}', "
+                          f"the error reads:\n{str(e)}")
+        return None
+
+
+class LazyMachines(Mapping[str, CPKMachine]):
+    """
+    Read-only mapping of the machines stored on disk.
+    Machine descriptors are only loaded (and validated) the first time they are accessed.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._cache: Dict[str, Optional[CPKMachine]] = {}
+
+    def _names(self) -> List[str]:
+        if not os.path.isdir(self._path):
+            return []
+        with os.scandir(self._path) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir() and
+                os.path.isfile(os.path.join(entry.path, "config.json"))
+            )
+
+    def _load(self, name: str) -> Optional[CPKMachine]:
+        if name not in self._cache:
+            self._cache[name] = load_machine(self._path, name)
+        return self._cache[name]
+
+    def __getitem__(self, name: str) -> CPKMachine:
+        machine = None
+        # names are directories inside the machines directory, never paths
+        if not isinstance(name, str) or not name or name.startswith(".") or \
+                os.sep in name or (os.altsep and os.altsep in name):
+            raise KeyError(name)
+        if os.path.isfile(os.path.join(self._path, name, "config.json")):
+            machine = self._load(name)
+        if machine is None:
+            raise KeyError(name)
+        return machine
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._names():
+            # only valid machines are listed
+            if self._load(name) is not None:
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def load_machines(path: str) -> Mapping[str, CPKMachine]:
+    return LazyMachines(path)
+
+
+def get_machine(parsed: argparse.Namespace, machines: Mapping[str, CPKMachine]) -> CPKMachine:
     if parsed.machine is None:
         cpklogger.debug("Argument 'parsed.machine' not set. Creating machine from environment.")
         return FromEnvMachine()
@@ -0,0 +1,40 @@
+import argparse
+import copy
+import os
+import unittest
+
+from cpk.cli.utils import get_project
+
+TEST_PROJECTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "assets", "projects"))
+
+
+class TestGetProject(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+
+    def test_same_instance_for_same_path(self):
+        path = os.path.join(TEST_PROJECTS_DIR, "basic")
+        os.chdir(path)
+        parsed = argparse.Namespace(workdir=".")
+        self.assertIs(get_project(parsed), get_project(parsed, path))
+        self.assertIs(get_project(parsed, path + os.sep), get_project(parsed))
+        # copies of the arguments share the same projects
+        self.assertIs(get_project(copy.deepcopy(parsed)), get_project(parsed))
+
+    def test_different_instances_for_different_paths(self):
+        parsed = argparse.Namespace(workdir=os.path.join(TEST_PROJECTS_DIR, "basic"))
+        minimal = get_project(parsed, os.path.join(TEST_PROJECTS_DIR, "minimal"))
+        self.assertIsNot(get_project(parsed), minimal)
+
+    def test_different_instances_for_different_invocations(self):
+        path = os.path.join(TEST_PROJECTS_DIR, "basic")
+        project = get_project(argparse.Namespace(workdir=path))
+        self.assertIsNot(get_project(argparse.Namespace(workdir=path)), project)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -453,6 +453,34 @@ class TestContainersProject(unittest.TestCase):
         )
         self.assertEqual(cfg1, cfg2)
 
+    def test_container_configuration_merge_volumes(self):
+        project: CPKProject = self.get_project("containers")
+        layer: CPKProjectContainersLayer = project.layers.containers
+        # ---
+        cfg1: DockertownContainerConfiguration = DockertownContainerConfiguration()
+        cfg2: DockertownContainerConfiguration = layer.get("development").as_dockertown_configuration()
+        # merging the same project twice mounts its volumes only once
+        cfg1.merge(config=cfg2, project=project)
+        cfg1.merge(config=cfg2, project=project)
+        self.assertEqual(cfg1.volumes, [(os.path.abspath(project.path), "${CPK_PROJECT_PATH}")])
+
+    def test_container_configuration_merge_volumes_same_destination(self):
+        project: CPKProject = self.get_project("containers")
+        layer: CPKProjectContainersLayer = project.layers.containers
+        # ---
+        cfg1: DockertownContainerConfiguration = layer.get("development").as_dockertown_configuration()
+        cfg2: DockertownContainerConfiguration = layer.get("development").as_dockertown_configuration()
+        # the relative './' volume and the absolute one merged in are the same bind mount
+        cfg1.merge(config=cfg2, project=project)
+        self.assertEqual(cfg1.volumes, [("./", "${CPK_PROJECT_PATH}")])
+        # a different source for the same destination is ignored, the first one wins
+        cfg3: DockertownContainerConfiguration = DockertownContainerConfiguration(
+            volumes=[("/tmp", "${CPK_PROJECT_PATH}/", "ro")]
+        )
+        with self.assertLogs("cpk", level="WARNING"):
+            cfg1.merge(config=cfg3, project=project)
+        self.assertEqual(cfg1.volumes, [("./", "${CPK_PROJECT_PATH}")])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import unittest
+
+from cpk.machine import TCPMachine
+from cpk.utils.machine import LazyMachines
+
+
+class TestLazyMachines(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = self._tmpdir.name
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def add_machine(self, name: str, descriptor):
+        machine_dir = os.path.join(self.path, name)
+        os.makedirs(machine_dir)
+        with open(os.path.join(machine_dir, "config.json"), "wt") as fout:
+            if isinstance(descriptor, dict):
+                json.dump(descriptor, fout)
+            else:
+                fout.write(descriptor)
+
+    def add_tcp_machine(self, name: str, host: str = "localhost"):
+        self.add_machine(name, {
+            "version": "1.0",
+            "type": "tcp",
+            "description": "",
+            "configuration": {"host": host}
+        })
+
+    def test_valid_lookup(self):
+        self.add_tcp_machine("alpha", "alpha.local")
+        machines = LazyMachines(self.path)
+        machine = machines["alpha"]
+        self.assertIsInstance(machine, TCPMachine)
+        self.assertEqual(machine.name, "alpha")
+        # descriptors are only loaded once
+        self.assertIs(machines["alpha"], machine)
+
+    def test_invalid_descriptor_is_skipped(self):
+        self.add_tcp_machine("alpha")
+        self.add_machine("broken", "{not json")
+        machines = LazyMachines(self.path)
+        with self.assertLogs("cpk", level="WARNING") as logs:
+            self.assertEqual(list(machines), ["alpha"])
+        self.assertTrue(any("broken" in line for line in logs.output))
+        self.assertNotIn("broken", machines)
+        self.assertIsNone(machines.get("broken"))
+
+    def test_unknown_names(self):
+        self.add_tcp_machine("alpha")
+        machines = LazyMachines(self.path)
+        self.assertNotIn("beta", machines)
+        self.assertIsNone(machines.get("beta"))
+        self.assertEqual(machines.get("beta", "default"), "default")
+        with self.assertRaises(KeyError):
+            _ = machines["beta"]
+
+    def test_paths_are_not_names(self):
+        self.add_tcp_machine("alpha")
+        other = tempfile.TemporaryDirectory()
+        self.addCleanup(other.cleanup)
+        with open(os.path.join(other.name, "config.json"), "wt") as fout:
+            json.dump({"version": "1.0", "type": "tcp", "configuration": {"host": "x"}}, fout)
+        machines = LazyMachines(self.path)
+        self.assertNotIn(other.name, machines)
+        self.assertNotIn(os.path.join("..", os.path.basename(other.name)), machines)
+        self.assertNotIn(os.path.join("alpha", ""), machines)
+
+    def test_len_and_order(self):
+        for name in ["charlie", "alpha", "bravo"]:
+            self.add_tcp_machine(name)
+        # hidden directories and directories without a descriptor are not machines
+        self.add_tcp_machine(".hidden")
+        os.makedirs(os.path.join(self.path, "empty"))
+        machines = LazyMachines(self.path)
+        self.assertEqual(len(machines), 3)
+        self.assertEqual(list(machines), ["alpha", "bravo", "charlie"])
+        self.assertNotIn(".hidden", machines)
+
+    def test_missing_directory(self):
+        machines = LazyMachines(os.path.join(self.path, "nope"))
+        self.assertEqual(len(machines), 0)
+        self.assertEqual(list(machines), [])
+
+
+if __name__ == '__main__':
+    unittest.main()